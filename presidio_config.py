@@ -1,17 +1,257 @@
-import pandas as pd
-from unidecode import unidecode
 import zipfile
+import csv
+import io
+import fnmatch
 import glob
+import os
 import re
-from presidio_analyzer import AnalyzerEngine, PatternRecognizer, Pattern
+import sys
+import threading
+import json
+import functools
+from itertools import chain
+import pyarrow as pa
+import pyarrow.compute as pc
+from presidio_analyzer import AnalyzerEngine, EntityRecognizer, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpEngineProvider
 from presidio_anonymizer import AnonymizerEngine
 
-def process_name_txt_files(folder_path, name_list, file_extension='*.txt', top_n=1000):
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Names, locations and datetimes are mostly caught by the deny lists, so the small spaCy model is enough for NER
+NLP_CONFIGURATION = {
+    "nlp_engine_name": "spacy",
+    "models": [{"lang_code": "en", "model_name": "en_core_web_sm"}],
+}
+
+# Country, state, city and airport names, datetime words and email domains, keyed by list name
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "static_lists.json"), encoding="utf-8") as static_lists_file:
+    _STATIC_LISTS = json.load(static_lists_file)
+
+_NUMBER_RE = re.compile(r"\b\d+\b")
+# Presidio matched patterns case-insensitively, so lowercase single characters are recognized too
+_SINGLE_CHAR_RE = re.compile(r"(?<= )([B-HJ-Z])(?= )", re.IGNORECASE)
+EMAIL_DOMAINS = _STATIC_LISTS["email_domains"]
+# Email provider names derived from the domains, e.g. "gmail.com" -> "Gmail"
+EMAIL_DENY = frozenset(sys.intern(domain.split(".")[0].title()) for domain in EMAIL_DOMAINS)
+
+def _compile_datetime_regex(month_list, week_list, time_list):
     """
-    Processes .txt files to append names.
+    Compiles month, week day and time names into one case-insensitive, word-bounded alternation.
+    """
+    words = map(re.escape, month_list + week_list + time_list)
+    return re.compile(r"(?<!\w)(?:" + "|".join(words) + r")(?!\w)", re.IGNORECASE)
+
+# "May" is intentionally left out of the month names
+_DATETIME_RE = _compile_datetime_regex(
+    _STATIC_LISTS["month_list"], _STATIC_LISTS["week_list"], _STATIC_LISTS["time_list"]
+)
+
+class RegexRecognizer(EntityRecognizer):
+    """
+    A recognizer that reports every match of an already compiled regex.
 
     Parameters:
-        folder_path (str): Path to the folder.
+        pattern (re.Pattern): The compiled regex to match.
+        supported_entity (str): The entity type assigned to every match.
+        score (float): The confidence score of a match.
+        name (str): Optional name of the recognizer.
+    """
+    def __init__(self, pattern, supported_entity, score, name=None):
+        self.pattern = pattern
+        self.score = score
+        super().__init__(supported_entities=[supported_entity], name=name)
+
+    def load(self):
+        pass
+
+    def analyze(self, text, entities, nlp_artifacts=None):
+        entity_type = self.supported_entities[0]
+        metadata = {
+            RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+        }
+        return [
+            RecognizerResult(entity_type, match.start(), match.end(), self.score, recognition_metadata=metadata)
+            for match in self.pattern.finditer(text)
+        ]
+
+class DenyListRecognizer(EntityRecognizer):
+    """
+    A recognizer that matches the deny lists of several entities in a single pass over the text.
+
+    Terms are matched case-insensitively on word boundaries like Presidio's deny_list. All terms
+    are compiled into one Hyperscan database when python-hyperscan is installed, else into one
+    Aho-Corasick automaton when pyahocorasick is installed, else into one alternation regex sorted
+    longest first. Every backend returns the same non-overlapping matches: the leftmost match wins,
+    and the longest term wins at a position, so e.g. "New York City" wins over "New York".
+
+    Parameters:
+        deny_lists (dict): Mapping of entity type to the terms to recognize for it.
+        score (float): The confidence score of a match. Default is 1.0.
+        name (str): Optional name of the recognizer.
+    """
+    def __init__(self, deny_lists, score=1.0, name=None):
+        self.score = score
+        # Lowercased term -> entity types it belongs to, e.g. "washington" is a PERSON and a LOCATION
+        self.terms = {}
+        for entity_type, deny_list in deny_lists.items():
+            entity_type = sys.intern(entity_type)
+            for term in deny_list:
+                key = sys.intern(term.lower())
+                if entity_type not in self.terms.get(key, ()):
+                    self.terms[key] = self.terms.get(key, ()) + (entity_type,)
+
+        self.database = self.automaton = self.pattern = None
+        if hyperscan is not None:
+            # Hyperscan reports a match by the index of its expression
+            self.keys = list(self.terms)
+            self.database = hyperscan.Database()
+            self.database.compile(
+                expressions=[key.encode("utf-8") for key in self.keys],
+                ids=list(range(len(self.keys))),
+                elements=len(self.keys),
+                flags=hyperscan.HS_FLAG_SOM_LEFTMOST,
+                literal=True,
+            )
+            # A scratch space can only be used by one scan at a time, so each thread gets its own
+            self._scratch = threading.local()
+        elif ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for key in self.terms:
+                self.automaton.add_word(key, key)
+            self.automaton.make_automaton()
+        else:
+            # re tries alternatives in order, so longest first makes the longest term win
+            terms = sorted(self.terms, key=lambda term: (-len(term), term))
+            self.pattern = re.compile(
+                r"(?<!\w)(?:" + "|".join(map(re.escape, terms)) + r")(?!\w)", re.IGNORECASE
+            )
+        super().__init__(supported_entities=list(deny_lists), name=name)
+
+    def load(self):
+        pass
+
+    def analyze(self, text, entities, nlp_artifacts=None):
+        metadata = {
+            RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+        }
+        return [
+            RecognizerResult(entity_type, start, end, self.score, recognition_metadata=metadata)
+            for start, end, entity_types in self._find_terms(text)
+            for entity_type in entity_types
+            if entity_type in entities
+        ]
+
+    def _find_terms(self, text):
+        """
+        Yields (start, end, entity_types) for every deny list term found in text.
+        """
+        if self.pattern is not None:
+            for match in self.pattern.finditer(text):
+                yield match.start(), match.end(), self.terms.get(match.group().lower(), ())
+            return
+
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters lowercase to more than one character; keep offsets aligned
+            lowered = "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+        if self.database is not None:
+            matches = self._scan_database(lowered)
+        else:
+            matches = (
+                (last - len(key) + 1, last + 1, key) for last, key in self.automaton.iter(lowered)
+            )
+        # Automatons report every term, overlapping ones included. Keep the longest match at the leftmost
+        # position and drop anything overlapping it, e.g. "York" in "New York", like re.finditer would
+        furthest_end = -1
+        for start, end, key in sorted(matches, key=lambda match: (match[0], -match[1])):
+            if _is_word_char(lowered, start - 1) or _is_word_char(lowered, end):
+                continue
+            if start < furthest_end:
+                continue
+            furthest_end = end
+            yield start, end, self.terms[key]
+
+    def _scan_database(self, lowered):
+        """
+        Returns (start, end, key) for every term the Hyperscan database finds in the lowercased text.
+        """
+        data = lowered.encode("utf-8")
+        if len(data) == len(lowered):
+            char_offsets = None
+        else:
+            # Map UTF-8 byte offsets back to character offsets
+            char_offsets = [index for index, char in enumerate(lowered) for _ in char.encode("utf-8")]
+            char_offsets.append(len(lowered))
+
+        matches = []
+        def on_match(index, start, end, flags, context):
+            if char_offsets is not None:
+                start, end = char_offsets[start], char_offsets[end]
+            matches.append((start, end, self.keys[index]))
+
+        scratch = getattr(self._scratch, "scratch", None)
+        if scratch is None:
+            scratch = self._scratch.scratch = hyperscan.Scratch(self.database)
+        self.database.scan(data, match_event_handler=on_match, scratch=scratch)
+        return matches
+
+def _is_word_char(text, index):
+    """
+    Checks whether text[index] exists and is a regex word character (\\w).
+    """
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == "_")
+
+# Accented Latin letters found in the hispanic name files, mapped to their ASCII base letter
+_ACCENT_TABLE = str.maketrans(
+    "ÁÀÂÄÃÉÈÊËÍÌÎÏÓÒÔÖÕÚÙÛÜÑÇáàâäãéèêëíìîïóòôöõúùûüñç",
+    "AAAAAEEEEIIIIOOOOOUUUUNCaaaaaeeeeiiiiooooouuuunc",
+)
+
+def _strip_accents(name):
+    """
+    Transliterates name to ASCII, falling back to unidecode for characters outside _ACCENT_TABLE.
+    """
+    name = name.translate(_ACCENT_TABLE)
+    if name.isascii():
+        return name
+
+    from unidecode import unidecode
+    return unidecode(name)
+
+def _read_txt_names(zip_file, info, top_n):
+    """
+    Reads the names of a single .txt member of zip_file whose 'Number' is larger than top_n.
+    """
+    with io.TextIOWrapper(zip_file.open(info), encoding="utf-8", newline="") as file:
+        return [row[0] for row in csv.reader(file) if int(row[2]) > top_n]
+
+def _read_csv_names(file, top_n):
+    """
+    Reads the names of a single .csv file whose number is larger than top_n.
+    """
+    with open(file, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        # Skip the header row
+        next(reader)
+        return [_strip_accents(row[0]) for row in reader if row[0] and int(row[1]) > top_n]
+
+def process_name_txt_files(zip_file, name_list, file_extension='*.txt', top_n=1000):
+    """
+    Processes .txt files to append names, reading them straight from a zip archive.
+
+    Parameters:
+        zip_file (zipfile.ZipFile): The opened zip archive containing the .txt files.
         name_list (list): List where the processed names are added.
         file_extension (str): File extension to filter files, default is '*.txt'.
         top_n (int): Only rows where the 'Number' column is larger than top_n are processed.
@@ -19,10 +259,9 @@ def process_name_txt_files(folder_path, name_list, file_extension='*.txt', top_n
     Returns:
         list: The updated name_list with names extracted from .txt files.
     """
-    for file in glob.glob(f"{folder_path}/{file_extension}"):
-        data = pd.read_csv(file, header=None, names=["Name", "Gender", "Number"])
-        data = data[data["Number"] > top_n]
-        name_list.extend(data["Name"])
+    for info in zip_file.infolist():
+        if fnmatch.fnmatch(info.filename, file_extension):
+            name_list.extend(_read_txt_names(zip_file, info, top_n))
     
     return name_list
 
@@ -39,9 +278,7 @@ def process_name_csv_files(csv_folder_path, name_list, top_n=1000):
         list: The updated name_list with names extracted from .csv files.
     """
     for file in glob.glob(f"{csv_folder_path}/*.csv"):
-        data = pd.read_csv(file, header=None, skiprows=1)
-        data = data[data[1] > top_n]
-        name_list.extend(unidecode(item) for item in data.iloc[:, 0].dropna().tolist())
+        name_list.extend(_read_csv_names(file, top_n))
 
     return name_list
 
@@ -53,13 +290,12 @@ def get_unique_names(name_list, remove_list):
        name_list (List): The list of names.
        remove_list (List): The list of names to remove.
     Returns:
-        List: Unique and filtered list of names.
+        frozenset: Unique and filtered set of names.
     """
     # Get unique names
-    name_list = sorted(
-        list(set([word.title() for name in name_list for word in name.split(" ")]))
-    )
-    name_list = [name for name in name_list if name not in remove_list]
+    names = {word.title() for name in name_list for word in name.split(" ")} - set(remove_list)
+    # Intern names so the copies shared with other deny lists are a single object
+    name_list = frozenset(map(sys.intern, names))
     
     return name_list
 
@@ -71,9 +307,9 @@ def get_name_recognizer(unique_names):
         unique_names: The list of unique names to recognize.
 
     Returns:
-        name_recognizer(PatternRecognizer): The initialized and configured recognizer.
+        name_recognizer(DenyListRecognizer): The initialized and configured recognizer.
     """
-    name_recognizer = PatternRecognizer(supported_entity="PERSON", deny_list=unique_names)
+    name_recognizer = DenyListRecognizer({"PERSON": unique_names})
     return name_recognizer
 
 def get_number_recognizer(confidence=0.5):
@@ -84,10 +320,9 @@ def get_number_recognizer(confidence=0.5):
         confidence (float): The assigned confidence level for the pattern. Default is 0.5.
 
     Returns:
-        number_recognizer(PatternRecognizer): The initialized and configured recognizer.
+        number_recognizer(RegexRecognizer): The initialized and configured recognizer.
     """
-    number_pattern = Pattern("NUMBER (\d+)", r"\b\d+\b", confidence)
-    number_recognizer = PatternRecognizer(supported_entity="NUMBER", name="number_recognizer", patterns=[number_pattern])
+    number_recognizer = RegexRecognizer(_NUMBER_RE, "NUMBER", confidence, name="number_recognizer")
     return number_recognizer
 
 def get_single_char_recognizer(confidence=0.8):
@@ -98,47 +333,54 @@ def get_single_char_recognizer(confidence=0.8):
         confidence (float): The assigned confidence level for the pattern. Default is 0.8.
 
     Returns:
-        single_char_recognizer(PatternRecognizer): The initialized and configured recognizer.
+        single_char_recognizer(RegexRecognizer): The initialized and configured recognizer.
     """
-    patterns = [Pattern("SingleCharExcludeAI", r"(?<= )([B-HJ-Z])(?= )", confidence)]
-    single_char_recognizer = PatternRecognizer(
-        supported_entity="SINGLE_CHAR_EXCLUDE_AI", patterns=patterns
+    single_char_recognizer = RegexRecognizer(
+        _SINGLE_CHAR_RE, "SINGLE_CHAR_EXCLUDE_AI", confidence, name="single_char_recognizer"
     )
     return single_char_recognizer
 
-def get_datetime_recognizer(month_list, week_list, time_list):
+def get_datetime_recognizer(month_list=None, week_list=None, time_list=None, confidence=1.0):
     """
-    This function initializes a Presidio datetime recognizer with extended patterns.
+    This function initializes a Presidio datetime recognizer for month, week day and time names.
     
     Parameters:
-        month_list (list): List of month names.
-        week_list (list): List of week day names.
-        time_list (list): List of specific time-related names.
+        month_list (list): List of month names. Default is the month names in data/static_lists.json.
+        week_list (list): List of week day names. Default is the week day names in data/static_lists.json.
+        time_list (list): List of specific time-related names. Default is the time names in data/static_lists.json.
+        confidence (float): The assigned confidence level for the pattern. Default is 1.0.
 
     Returns:
-        datetime_recognizer(PatternRecognizer): The initialized and configured datetime recognizer.
+        datetime_recognizer(RegexRecognizer): The initialized and configured datetime recognizer.
     """
-    
-    datetime_list = month_list + week_list + time_list
-
-    datetime_recognizer = PatternRecognizer(
-        supported_entity="DATE_TIME", deny_list=datetime_list
-    )
-    
+    if month_list is None and week_list is None and time_list is None:
+        # The default lists are compiled once at import
+        pattern = _DATETIME_RE
+    else:
+        pattern = _compile_datetime_regex(
+            _STATIC_LISTS["month_list"] if month_list is None else month_list,
+            _STATIC_LISTS["week_list"] if week_list is None else week_list,
+            _STATIC_LISTS["time_list"] if time_list is None else time_list,
+        )
+    datetime_recognizer = RegexRecognizer(pattern, "DATE_TIME", confidence, name="datetime_recognizer")
     return datetime_recognizer
 
-def get_email_recognizer(email_domains):
+def get_email_recognizer(email_domains=None):
     """
     This function initializes and configures an email domain recognizer for Presidio.
     
     Parameters:
-        email_domains (list): List of email domains.
+        email_domains (list): List of email domains. Default is the email domains in data/static_lists.json.
 
     Returns:
-        email_recognizer(PatternRecognizer): The initialized and configured email recognizer.
+        email_recognizer(DenyListRecognizer): The initialized and configured email recognizer.
     """
-    email_list = list(set([domain.split(".")[0].title() for domain in email_domains]))
-    email_recognizer = PatternRecognizer(supported_entity="EMAIL_DOMAIN", deny_list=email_list)
+    if email_domains is None:
+        # The default provider names are derived once at import
+        email_list = EMAIL_DENY
+    else:
+        email_list = frozenset(sys.intern(domain.split(".")[0].title()) for domain in email_domains)
+    email_recognizer = DenyListRecognizer({"EMAIL_DOMAIN": email_list})
     return email_recognizer
 
 def generate_location_list(country_names, state_names, city_names, airport_names):
@@ -152,20 +394,28 @@ def generate_location_list(country_names, state_names, city_names, airport_names
         airport_names (list): List of airport names.
 
     Returns:
-        list: Compiled list of location names.
+        frozenset: Compiled set of location names.
     """
 
-    location_list = sorted(
-        list(set(country_names + state_names + city_names + airport_names))
-    )
-    
-    location_list = [
-        " ".join(re.sub(r"\(.*?\)", "", item).split()).title()
-        for item in location_list
-    ]
+    location_list = set(chain(country_names, state_names, city_names, airport_names))
+    location_list = pa.array(list(location_list), type=pa.string())
+
+    # Remove parenthesized qualifiers, e.g. "Croatia (Hrvatska)", then normalize whitespace and casing
+    location_list = pc.replace_substring_regex(location_list, r"\s*\([^)]*\)", "")
+    location_list = pc.replace_substring_regex(location_list, r"\s+", " ")
+    location_list = pc.utf8_title(pc.utf8_trim_whitespace(location_list))
+
+    location_list = frozenset(map(sys.intern, location_list.to_pylist()))
     
     return location_list
 
+LOCATION_LIST = generate_location_list(
+    _STATIC_LISTS["country_names"],
+    _STATIC_LISTS["state_names"],
+    _STATIC_LISTS["city_names"],
+    _STATIC_LISTS["airport_names"],
+)
+
 def get_location_recognizer(location_list):
     """
     This function initializes and configures a location recognizer for Presidio.
@@ -174,17 +424,19 @@ def get_location_recognizer(location_list):
         location_list (list): List of location names to recognize.
 
     Returns:
-        location_recognizer(PatternRecognizer): The initialized and configured location recognizer.
+        location_recognizer(DenyListRecognizer): The initialized and configured location recognizer.
     """
-    location_recognizer = PatternRecognizer(
-            supported_entity="LOCATION", deny_list=location_list
-        )
+    location_recognizer = DenyListRecognizer({"LOCATION": location_list})
     return location_recognizer
 
 
+@functools.lru_cache(maxsize=1)
 def run():
     """
     The main function to organize and control the process of creating recognizers and preprocessing data.
+
+    The engines are built once and cached, so repeated calls return the same analyzer and anonymizer.
+    Call run.cache_clear() to rebuild them, e.g. after the name data changed.
     """
     ## PREPROCESSING FOR NAME RECOGNIZER ##
     # List to hold names
@@ -194,12 +446,9 @@ def run():
     # Path to zipped folder
     path_to_zip = "data/names.zip"
 
-    # Extract zipped folder
+    # Process names from .txt files in the zipped folder
     with zipfile.ZipFile(path_to_zip, "r") as zip_ref:
-        zip_ref.extractall("data/ssa_names")
-
-    # Process names from .txt files
-    name_list = process_name_txt_files(folder_path="data/ssa_names", name_list=name_list)
+        name_list = process_name_txt_files(zip_file=zip_ref, name_list=name_list)
 
     # Process names from .csv files
     name_list = process_name_csv_files(csv_folder_path="data/hispanic_names", name_list=name_list)
@@ -211,798 +460,26 @@ def run():
     unique_names = get_unique_names(name_list, remove_list)
     ##
 
-    ## PREPROCESSING FOR LOCATION RECOGNIZER ##
-    # Define lists of location categories
-    country_names = [
-        "United States",
-        "America",
-        "Canada",
-        "Afghanistan",
-        "Albania",
-        "Algeria",
-        "American Samoa",
-        "Andorra",
-        "Angola",
-        "Anguilla",
-        "Antarctica",
-        "Antigua and Barbuda",
-        "Argentina",
-        "Armenia",
-        "Aruba",
-        "Australia",
-        "Austria",
-        "Azerbaijan",
-        "Bahamas",
-        "Bahrain",
-        "Bangladesh",
-        "Barbados",
-        "Belarus",
-        "Belgium",
-        "Belize",
-        "Benin",
-        "Bermuda",
-        "Bhutan",
-        "Bolivia",
-        "Bosnia and Herzegovina",
-        "Botswana",
-        "Bouvet Island",
-        "Brazil",
-        "British Indian Ocean Territory",
-        "Brunei Darussalam",
-        "Bulgaria",
-        "Burkina Faso",
-        "Burundi",
-        "Cambodia",
-        "Cameroon",
-        "Cape Verde",
-        "Cayman Islands",
-        "Central African Republic",
-        "Chad",
-        "Chile",
-        "China",
-        "Christmas Island",
-        "Cocos (Keeling) Islands",
-        "Colombia",
-        "Comoros",
-        "Congo",
-        "Cook Islands",
-        "Costa Rica",
-        "Croatia (Hrvatska)",
-        "Cuba",
-        "Cyprus",
-        "Czech Republic",
-        "Denmark",
-        "Djibouti",
-        "Dominica",
-        "Dominican Republic",
-        "East Timor",
-        "Ecudaor",
-        "Egypt",
-        "El Salvador",
-        "Equatorial Guinea",
-        "Eritrea",
-        "Estonia",
-        "Ethiopia",
-        "Falkland Islands",
-        "Faroe Islands",
-        "Fiji",
-        "Finland",
-        "France",
-        "France, Metropolitan",
-        "French Guiana",
-        "French Polynesia",
-        "French Southern Territories",
-        "Gabon",
-        "Gambia",
-        "Georgia",
-        "Germany",
-        "Ghana",
-        "Gibraltar",
-        "Greece",
-        "Greenland",
-        "Grenada",
-        "Guadeloupe",
-        "Guam",
-        "Guatemala",
-        "Guinea",
-        "Guinea-Bissau",
-        "Guyana",
-        "Haiti",
-        "Heard and Mc Donald Islands",
-        "Honduras",
-        "Hong Kong",
-        "Hungary",
-        "Iceland",
-        "India",
-        "Indonesia",
-        "Iran",
-        "Iraq",
-        "Ireland",
-        "Israel",
-        "Italy",
-        "Ivory Coast",
-        "Jamaica",
-        "Japan",
-        "Jordan",
-        "Kazakhstan",
-        "Kenya",
-        "Kiribati",
-        "Korea",
-        "Kosovo",
-        "Kuwait",
-        "Kyrgyzstan",
-        "Laos",
-        "Latvia",
-        "Lebanon",
-        "Lesotho",
-        "Liberia",
-        "Libya",
-        "Liechtenstein",
-        "Lithuania",
-        "Luxembourg",
-        "Macau",
-        "Macedonia",
-        "Madagascar",
-        "Malawi",
-        "Malaysia",
-        "Maldives",
-        "Mali",
-        "Malta",
-        "Marshall Islands",
-        "Martinique",
-        "Mauritania",
-        "Mauritius",
-        "Mayotte",
-        "Mexico",
-        "Micronesia",
-        "Moldova",
-        "Monaco",
-        "Mongolia",
-        "Montserrat",
-        "Morocco",
-        "Mozambique",
-        "Myanmar",
-        "Namibia",
-        "Nauru",
-        "Nepal",
-        "Netherlands",
-        "Netherlands Antilles",
-        "New Caledonia",
-        "New Zealand",
-        "Nicaragua",
-        "Niger",
-        "Nigeria",
-        "Niue",
-        "Norfork Island",
-        "Northern Mariana Islands",
-        "Norway",
-        "Oman",
-        "Pakistan",
-        "Palau",
-        "Panama",
-        "Papua New Guinea",
-        "Paraguay",
-        "Peru",
-        "Philippines",
-        "Pitcairn",
-        "Poland",
-        "Portugal",
-        "Puerto Rico",
-        "Qatar",
-        "Reunion",
-        "Romania",
-        "Russian Federation",
-        "Rwanda",
-        "Saint Kitts and Nevis",
-        "Saint Lucia",
-        "Saint Vincent and the Grenadines",
-        "Samoa",
-        "San Marino",
-        "Sao Tome and Principe",
-        "Saudi Arabia",
-        "Senegal",
-        "Seychelles",
-        "Sierra Leone",
-        "Singapore",
-        "Slovakia",
-        "Slovenia",
-        "Solomon Islands",
-        "Somalia",
-        "South Africa",
-        "South Georgia South Sandwich Islands",
-        "South Sudan",
-        "Spain",
-        "Sri Lanka",
-        "St. Helena",
-        "St. Pierre and Miquelon",
-        "Sudan",
-        "Suriname",
-        "Svalbarn and Jan Mayen Islands",
-        "Swaziland",
-        "Sweden",
-        "Switzerland",
-        "Syrian Arab Republic",
-        "Taiwan",
-        "Tajikistan",
-        "Tanzania, United Republic of",
-        "Thailand",
-        "Togo",
-        "Tokelau",
-        "Tonga",
-        "Trinidad and Tobago",
-        "Tunisia",
-        "Turkey",
-        "Turkmenistan",
-        "Turks and Caicos Islands",
-        "Tuvalu",
-        "Uganda",
-        "Ukraine",
-        "United Arab Emirates",
-        "United Kingdom",
-        "United States minor outlying islands",
-        "Uruguay",
-        "Uzbekistan",
-        "Vanuatu",
-        "Vatican City State",
-        "Venezuela",
-        "Vietnam",
-        "Virigan Islands",
-        "Wallis and Futuna Islands",
-        "Western Sahara",
-        "Yemen",
-        "Yugoslavia",
-        "Zaire",
-        "Zambia",
-        "Zimbabwe",
-    ]
-    state_names = [
-        "Alaska",
-        "Alabama",
-        "Arkansas",
-        "American Samoa",
-        "Arizona",
-        "California",
-        "Colorado",
-        "Connecticut",
-        "District Of Columbia",
-        "Delaware",
-        "Florida",
-        "Georgia",
-        "Guam",
-        "Hawaii",
-        "Iowa",
-        "Idaho",
-        "Illinois",
-        "Indiana",
-        "Kansas",
-        "Kentucky",
-        "Louisiana",
-        "Massachusetts",
-        "Maryland",
-        "Maine",
-        "Michigan",
-        "Minnesota",
-        "Missouri",
-        "Mississippi",
-        "Montana",
-        "North Carolina",
-        "North Dakota",
-        "Nebraska",
-        "New Hampshire",
-        "New Jersey",
-        "New Mexico",
-        "Nevada",
-        "New York",
-        "Ohio",
-        "Oklahoma",
-        "Oregon",
-        "Pennsylvania",
-        "Puerto Rico",
-        "Rhode Island",
-        "South Carolina",
-        "South Dakota",
-        "Tennessee",
-        "Texas",
-        "Utah",
-        "Virginia",
-        "Virgin Islands",
-        "Vermont",
-        "Washington",
-        "Wisconsin",
-        "West Virginia",
-        "Wyoming",
-    ]
-    city_names = [
-        "Aberdeen",
-        "Abilene",
-        "Akron",
-        "Albany",
-        "Albuquerque",
-        "Alexandria",
-        "Allentown",
-        "Amarillo",
-        "Anaheim",
-        "Anchorage",
-        "Ann Arbor",
-        "Antioch",
-        "Apple Valley",
-        "Appleton",
-        "Arlington",
-        "Arvada",
-        "Asheville",
-        "Athens",
-        "Atlanta",
-        "Atlantic City",
-        "Augusta",
-        "Aurora",
-        "Austin",
-        "Bakersfield",
-        "Baltimore",
-        "Barnstable",
-        "Baton Rouge",
-        "Beaumont",
-        "Bel Air",
-        "Bellevue",
-        "Berkeley",
-        "Bethlehem",
-        "Billings",
-        "Birmingham",
-        "Bloomington",
-        "Boise",
-        "Boise City",
-        "Bonita Springs",
-        "Boston",
-        "Boulder",
-        "Bradenton",
-        "Bremerton",
-        "Bridgeport",
-        "Brighton",
-        "Brownsville",
-        "Bryan",
-        "Buffalo",
-        "Burbank",
-        "Burlington",
-        "Cambridge",
-        "Canton",
-        "Cape Coral",
-        "Carrollton",
-        "Cary",
-        "Cathedral City",
-        "Cedar Rapids",
-        "Champaign",
-        "Chandler",
-        "Charleston",
-        "Charlotte",
-        "Chattanooga",
-        "Chesapeake",
-        "Chicago",
-        "Chula Vista",
-        "Cincinnati",
-        "Clarke County",
-        "Clarksville",
-        "Clearwater",
-        "Cleveland",
-        "College Station",
-        "Colorado Springs",
-        "Columbia",
-        "Columbus",
-        "Concord",
-        "Coral Springs",
-        "Corona",
-        "Corpus Christi",
-        "Costa Mesa",
-        "Dallas",
-        "Daly City",
-        "Danbury",
-        "Davenport",
-        "Davidson County",
-        "Dayton",
-        "Daytona Beach",
-        "Deltona",
-        "Denton",
-        "Denver",
-        "Des Moines",
-        "Detroit",
-        "Downey",
-        "Duluth",
-        "Durham",
-        "El Monte",
-        "El Paso",
-        "Elizabeth",
-        "Elk Grove",
-        "Elkhart",
-        "Erie",
-        "Escondido",
-        "Eugene",
-        "Evansville",
-        "Fairfield",
-        "Fargo",
-        "Fayetteville",
-        "Fitchburg",
-        "Flint",
-        "Fontana",
-        "Fort Collins",
-        "Fort Lauderdale",
-        "Fort Smith",
-        "Fort Walton Beach",
-        "Fort Wayne",
-        "Fort Worth",
-        "Frederick",
-        "Fremont",
-        "Fresno",
-        "Fullerton",
-        "Gainesville",
-        "Garden Grove",
-        "Garland",
-        "Gastonia",
-        "Gilbert",
-        "Glendale",
-        "Grand Prairie",
-        "Grand Rapids",
-        "Grayslake",
-        "Green Bay",
-        "GreenBay",
-        "Greensboro",
-        "Greenville",
-        "Gulfport-Biloxi",
-        "Hagerstown",
-        "Hampton",
-        "Harlingen",
-        "Harrisburg",
-        "Hartford",
-        "Havre de Grace",
-        "Hayward",
-        "Hemet",
-        "Henderson",
-        "Hesperia",
-        "Hialeah",
-        "Hickory",
-        "High Point",
-        "Hollywood",
-        "Honolulu",
-        "Houma",
-        "Houston",
-        "Howell",
-        "Huntington",
-        "Huntington Beach",
-        "Huntsville",
-        "Independence",
-        "Indianapolis",
-        "Inglewood",
-        "Irvine",
-        "Irving",
-        "Jackson",
-        "Jacksonville",
-        "Jefferson",
-        "Jersey City",
-        "Johnson City",
-        "Joliet",
-        "Kailua",
-        "Kalamazoo",
-        "Kaneohe",
-        "Kansas City",
-        "Kennewick",
-        "Kenosha",
-        "Killeen",
-        "Kissimmee",
-        "Knoxville",
-        "Lacey",
-        "Lafayette",
-        "Lake Charles",
-        "Lakeland",
-        "Lakewood",
-        "Lancaster",
-        "Lansing",
-        "Laredo",
-        "Las Cruces",
-        "Las Vegas",
-        "Layton",
-        "Leominster",
-        "Lewisville",
-        "Lexington",
-        "Lincoln",
-        "Little Rock",
-        "Long Beach",
-        "Lorain",
-        "Los Angeles",
-        "Louisville",
-        "Lowell",
-        "Lubbock",
-        "Macon",
-        "Madison",
-        "Manchester",
-        "Marina",
-        "Marysville",
-        "McAllen",
-        "McHenry",
-        "Medford",
-        "Melbourne",
-        "Memphis",
-        "Merced",
-        "Mesa",
-        "Mesquite",
-        "Miami",
-        "Milwaukee",
-        "Minneapolis",
-        "Miramar",
-        "Mission Viejo",
-        "Mobile",
-        "Modesto",
-        "Monroe",
-        "Monterey",
-        "Montgomery",
-        "Moreno Valley",
-        "Murfreesboro",
-        "Murrieta",
-        "Muskegon",
-        "Myrtle Beach",
-        "Naperville",
-        "Naples",
-        "Nashua",
-        "Nashville",
-        "New Bedford",
-        "New Haven",
-        "New London",
-        "New Orleans",
-        "New York",
-        "New York City",
-        "Newark",
-        "Newburgh",
-        "Newport News",
-        "Norfolk",
-        "Normal",
-        "Norman",
-        "North Charleston",
-        "North Las Vegas",
-        "North Port",
-        "Norwalk",
-        "Norwich",
-        "Oakland",
-        "Ocala",
-        "Oceanside",
-        "Odessa",
-        "Ogden",
-        "Oklahoma City",
-        "Olathe",
-        "Olympia",
-        "Omaha",
-        "Ontario",
-        "Orange",
-        "Orem",
-        "Orlando",
-        "Overland Park",
-        "Oxnard",
-        "Palm Bay",
-        "Palm Springs",
-        "Palmdale",
-        "Panama City",
-        "Pasadena",
-        "Paterson",
-        "Pembroke Pines",
-        "Pensacola",
-        "Peoria",
-        "Philadelphia",
-        "Phoenix",
-        "Pittsburgh",
-        "Plano",
-        "Pomona",
-        "Pompano Beach",
-        "Port Arthur",
-        "Port Orange",
-        "Port Saint Lucie",
-        "Port St. Lucie",
-        "Portland",
-        "Portsmouth",
-        "Poughkeepsie",
-        "Providence",
-        "Provo",
-        "Pueblo",
-        "Punta Gorda",
-        "Racine",
-        "Raleigh",
-        "Rancho Cucamonga",
-        "Reading",
-        "Redding",
-        "Reno",
-        "Richland",
-        "Richmond",
-        "Richmond County",
-        "Riverside",
-        "Roanoke",
-        "Rochester",
-        "Rockford",
-        "Roseville",
-        "Round Lake Beach",
-        "Sacramento",
-        "Saginaw",
-        "Saint Louis",
-        "Saint Paul",
-        "Saint Petersburg",
-        "Salem",
-        "Salinas",
-        "Salt Lake City",
-        "San Antonio",
-        "San Bernardino",
-        "San Buenaventura",
-        "San Diego",
-        "San Francisco",
-        "San Jose",
-        "Santa Ana",
-        "Santa Barbara",
-        "Santa Clara",
-        "Santa Clarita",
-        "Santa Cruz",
-        "Santa Maria",
-        "Santa Rosa",
-        "Sarasota",
-        "Savannah",
-        "Scottsdale",
-        "Scranton",
-        "Seaside",
-        "Seattle",
-        "Sebastian",
-        "Shreveport",
-        "Simi Valley",
-        "Sioux City",
-        "Sioux Falls",
-        "South Bend",
-        "South Lyon",
-        "Spartanburg",
-        "Spokane",
-        "Springdale",
-        "Springfield",
-        "St. Louis",
-        "St. Paul",
-        "St. Petersburg",
-        "Stamford",
-        "Sterling Heights",
-        "Stockton",
-        "Sunnyvale",
-        "Syracuse",
-        "Tacoma",
-        "Tallahassee",
-        "Tampa",
-        "Temecula",
-        "Tempe",
-        "Thornton",
-        "Thousand Oaks",
-        "Toledo",
-        "Topeka",
-        "Torrance",
-        "Trenton",
-        "Tucson",
-        "Tulsa",
-        "Tuscaloosa",
-        "Tyler",
-        "Utica",
-        "Vallejo",
-        "Vancouver",
-        "Vero Beach",
-        "Victorville",
-        "Virginia Beach",
-        "Visalia",
-        "Waco",
-        "Warren",
-        "Washington",
-        "Waterbury",
-        "Waterloo",
-        "West Covina",
-        "West Valley City",
-        "Westminster",
-        "Wichita",
-        "Wilmington",
-        "Winston",
-        "Winter Haven",
-        "Worcester",
-        "Yakima",
-        "Yonkers",
-        "York",
-        "Youngstown",
-    ]
-    airport_names = [
-        "London Heathrow",
-        "Amsterdam",
-        "Kuala Lumpur",
-        "Tokyo Haneda",
-        "Istanbul",
-        "Seoul Incheon",
-        "Paris",
-        "Toronto",
-        "Singapore",
-        "Manila",
-        "Dubai",
-        "Soekarno Hatta",
-        "Munich",
-        "Sydney",
-        "Delhi",
-        "Madrid",
-        "Bogota",
-        "Fukuoka",
-        "Shanghai Pudong",
-        "Doha",
-        "Mumbai",
-        "Johannesburg",
-        "Rome Fiumicino",
-        "Athens",
-        "Barcelona",
-        "Taipei",
-        "Taoyuan",
-        "Guangzhou Baiyun",
-        "Hanoi",
-        "Riyadh",
-        "Auckland",
-        "Wellington",
-        "Melbourne",
-    ]
-
-    # Generate list of location names
-    location_list = generate_location_list(country_names, state_names, city_names, airport_names)
-    ##
-
-
-    ## PROPROCESSING FOR DATETIME RECOGNIZER ##
-    # Define datetime word lists
-    month_list = [
-        "January",
-        "February",
-        "March",
-        "April",
-        # "May",
-        "June",
-        "July",
-        "August",
-        "September",
-        "October",
-        "November",
-        "December",
-    ]
-    week_list = [
-        "Monday",
-        "Tuesday",
-        "Wednesday",
-        "Thursday",
-        "Friday",
-        "Saturday",
-        "Sunday",
-    ]
-    time_list = ["Noon", "Midnight"]
-    ##
-
-    ## PREPROCESSING FOR EMAIL DOMAIN RECOGNIZER ##
-    email_domains = [
-    "aol.com",
-    "att.net",
-    "comcast.net",
-    "facebook.com",
-    "gmail.com",
-    "gmx.com",
-    "googlemail.com",
-    "google.com",
-    "hotmail.com",
-    "mac.com",
-    "microsoft.com",
-    "msn.com",
-    "verizon.net",
-    "yahoo.com",
-]
-    ##
-
     # Create recognizers
-    name_recognizer = get_name_recognizer(unique_names)
-    location_recognizer = get_location_recognizer(location_list)
-    datetime_recognizer = get_datetime_recognizer(month_list, week_list, time_list)
+    deny_list_recognizer = DenyListRecognizer(
+        {
+            "PERSON": unique_names,
+            "LOCATION": LOCATION_LIST,
+            "EMAIL_DOMAIN": EMAIL_DENY,
+        },
+        name="deny_list_recognizer",
+    )
     number_recognizer = get_number_recognizer()
     single_char_recognizer = get_single_char_recognizer()
-    email_recognizer = get_email_recognizer(email_domains)
+    datetime_recognizer = get_datetime_recognizer()
 
     # Initialize the AnalyzerEngine
-    analyzer = AnalyzerEngine()
-    analyzer.registry.add_recognizer(name_recognizer)
+    nlp_engine = NlpEngineProvider(nlp_configuration=NLP_CONFIGURATION).create_engine()
+    analyzer = AnalyzerEngine(nlp_engine=nlp_engine)
+    analyzer.registry.add_recognizer(deny_list_recognizer)
     analyzer.registry.add_recognizer(number_recognizer)
     analyzer.registry.add_recognizer(single_char_recognizer)
     analyzer.registry.add_recognizer(datetime_recognizer)
-    analyzer.registry.add_recognizer(location_recognizer)
-    analyzer.registry.add_recognizer(email_recognizer)
 
     # Initialize the AnonymizerEngine
     anonymizer = AnonymizerEngine()